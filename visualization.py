@@ -14,21 +14,24 @@ Distinct from team's "Readiness" map - this focuses on DEMAND/NEED, not supply.
 """
 
 from pathlib import Path
-import json
-import re
+import os
 
 import geopandas as gpd
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import shapely
+from shapely.geometry import mapping
 
 # -------------------------------------------------------------------
 #  PATHS
 # -------------------------------------------------------------------
 try:
-    ROOT = Path(__file__).resolve().parent
+    SCRIPT_PATH = Path(__file__).resolve()
+    ROOT = SCRIPT_PATH.parent
 except NameError:
+    SCRIPT_PATH = None
     ROOT = Path.cwd()
 
 SHAPEFILE_PATH = ROOT / "cb_2018_48_cousub_500k" / "cb_2018_48_cousub_500k.shp"
@@ -37,6 +40,8 @@ SAIPE_PATH = ROOT / "saipe_tx_23.txt"
 # Updated to use newer CMS data (2020-2025)
 TELEHEALTH_PATH = ROOT / "Medicare Telehealth Trends" / "Medicare Telehealth Trends" / \
                   "2025-Q1" / "TMEDTREND_PUBLIC_250827.csv"
+# Parquet copies of the cleaned loader outputs
+CACHE_DIR = ROOT / ".cache"
 
 
 # -------------------------------------------------------------------
@@ -45,10 +50,14 @@ TELEHEALTH_PATH = ROOT / "Medicare Telehealth Trends" / "Medicare Telehealth Tre
 def load_texas_counties():
     """Load and dissolve Texas county geometries."""
     gdf = gpd.read_file(SHAPEFILE_PATH)
-    gdf = gdf[gdf["STATEFP"] == "48"].copy()
+    gdf = gdf.loc[gdf["STATEFP"] == "48", ["STATEFP", "COUNTYFP", "NAME", "geometry"]].copy()
     gdf["GEOID"] = gdf["STATEFP"] + gdf["COUNTYFP"]
-    counties = gdf.dissolve(by="GEOID", as_index=False)
+    # Only carry the columns we return through the dissolve
+    counties = gdf[["GEOID", "NAME", "geometry"]].dissolve(by="GEOID", aggfunc="first", as_index=False)
     counties = counties.to_crs(epsg=4326)
+    # Thin out vertices so the choropleth GeoJSON stays small (~0.5 km tolerance)
+    counties["geometry"] = counties.geometry.simplify(0.005, preserve_topology=True)
+    counties["GEOID"] = counties["GEOID"].astype("category")
     return counties[["GEOID", "NAME", "geometry"]]
 
 
@@ -58,44 +67,39 @@ def load_sahie():
     df.columns = ["Year", "ID", "Name", "Uninsured_Number", "Uninsured_MOE", 
                   "Uninsured_Pct", "Pct_MOE", "Demographic_Number", "Demographic_MOE"]
     
-    df = df[df["ID"].astype(str).str.len() == 5].copy()
-    df = df[df["ID"].astype(str).str.startswith("48")].copy()
+    # Texas FIPS codes are 48000-48999 (5 digits starting with "48")
+    ids = pd.to_numeric(df["ID"], errors="coerce")
+    mask = (ids >= 48000) & (ids < 49000)
+    df = df[mask].copy()
     
-    df["GEOID"] = df["ID"].astype(str).str.zfill(5)
+    df["GEOID"] = ids[mask].astype(int).astype(str)
     df["uninsured_pct"] = pd.to_numeric(df["Uninsured_Pct"], errors="coerce")
     df["County_Name"] = df["Name"].str.replace(" County, TX", "", regex=False)
     
-    return df[["GEOID", "County_Name", "uninsured_pct"]].dropna()
+    df = df[["GEOID", "County_Name", "uninsured_pct"]].dropna()
+    df["GEOID"] = df["GEOID"].astype("category")
+    df["County_Name"] = df["County_Name"].astype("category")
+    return df
 
 
 def load_saipe():
     """Load county-level poverty and income data."""
-    data = []
-    
-    with open(SAIPE_PATH, 'r') as f:
-        for line in f:
-            parts = line.split()
-            if len(parts) < 20 or parts[0] != "48" or parts[1] == "0":
-                continue
-            
-            try:
-                poverty_rate = float(parts[5])
-                child_poverty = float(parts[11])
-                median_income = int(parts[20])
-                
-                county_match = re.search(r'(\w+(?:\s+\w+)*)\s+County', line)
-                county_name = county_match.group(1) if county_match else f"County {parts[1]}"
-                
-                data.append({
-                    "GEOID": f"48{parts[1].zfill(3)}",
-                    "poverty_rate": poverty_rate,
-                    "child_poverty": child_poverty,
-                    "median_income": median_income
-                })
-            except (ValueError, IndexError):
-                continue
-    
-    return pd.DataFrame(data)
+    # Fixed-width column positions from the Census SAIPE state/county file layout
+    colspecs = [(0, 2), (3, 6), (34, 38), (76, 80), (133, 139)]
+    names = ["state", "county", "poverty_rate", "child_poverty", "median_income"]
+    df = pd.read_fwf(SAIPE_PATH, colspecs=colspecs, names=names, header=None,
+                     dtype={"state": str, "county": str})
+    
+    df = df[(df["state"] == "48") & (df["county"] != "0")].copy()
+    for col in ["poverty_rate", "child_poverty", "median_income"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df = df.dropna(subset=["poverty_rate", "child_poverty", "median_income"])
+    
+    df["GEOID"] = "48" + df["county"].str.zfill(3)
+    df["median_income"] = df["median_income"].astype(int)
+    df["GEOID"] = df["GEOID"].astype("category")
+    
+    return df[["GEOID", "poverty_rate", "child_poverty", "median_income"]].reset_index(drop=True)
 
 
 def load_telehealth_trends():
@@ -103,48 +107,113 @@ def load_telehealth_trends():
     Load Texas telehealth adoption trends (2020-2024).
     New CMS data format with annual data by enrollment status and rural/urban.
     """
-    df = pd.read_csv(TELEHEALTH_PATH)
+    # Only read the columns used below; the pyarrow engine parses in parallel
+    columns = ["Year", "quarter", "Bene_Geo_Desc", "Bene_Mdcd_Mdcr_Enrl_Stus",
+               "Bene_Race_Desc", "Bene_Sex_Desc", "Bene_Mdcr_Entlmt_Stus",
+               "Bene_Age_Desc", "Bene_RUCA_Desc", "Pct_Telehealth"]
+    df = pd.read_csv(TELEHEALTH_PATH, engine="pyarrow", usecols=columns)
     
     # Filter to Texas, annual data (Overall quarter)
     tx = df[(df["Bene_Geo_Desc"] == "Texas") & 
             (df["quarter"] == "Overall")].copy()
     
-    # Base filter for demographic breakdowns
-    base_filter = (
+    # Rows without race/sex/entitlement/age breakdowns
+    common = tx[
         (tx["Bene_Race_Desc"] == "All") &
         (tx["Bene_Sex_Desc"] == "All") &
         (tx["Bene_Mdcr_Entlmt_Stus"] == "All") &
-        (tx["Bene_Age_Desc"] == "All") &
-        (tx["Bene_RUCA_Desc"] == "All")
-    )
+        (tx["Bene_Age_Desc"] == "All")
+    ].copy()
+    
+    # Convert to percentages and add year column
+    common["telehealth_pct"] = common["Pct_Telehealth"] * 100
+    common["year"] = common["Year"].astype(int)
+    
+    groups = common.groupby(["Bene_Mdcd_Mdcr_Enrl_Stus", "Bene_RUCA_Desc"])
+    
+    def get_series(enrollment, ruca, required=True):
+        try:
+            return groups.get_group((enrollment, ruca))
+        except KeyError:
+            if not required:
+                return common.iloc[:0]
+            raise ValueError(
+                f"No Texas telehealth rows for enrollment status {enrollment!r} "
+                f"and RUCA {ruca!r} in {TELEHEALTH_PATH.name}"
+            ) from None
     
     # Medicare Only (higher income proxy)
-    medicare_only = tx[base_filter & 
-                       (tx["Bene_Mdcd_Mdcr_Enrl_Stus"] == "Medicare Only")].copy()
+    medicare_only = get_series("Medicare Only", "All")
     
     # Dual-eligible / Medicare & Medicaid (low-income proxy)
-    dual = tx[base_filter & 
-              (tx["Bene_Mdcd_Mdcr_Enrl_Stus"] == "Medicare & Medicaid")].copy()
+    dual = get_series("Medicare & Medicaid", "All")
     
-    # Rural vs Urban (for all enrollment)
-    rural_urban_filter = (
-        (tx["Bene_Race_Desc"] == "All") &
-        (tx["Bene_Sex_Desc"] == "All") &
-        (tx["Bene_Mdcr_Entlmt_Stus"] == "All") &
-        (tx["Bene_Age_Desc"] == "All") &
-        (tx["Bene_Mdcd_Mdcr_Enrl_Stus"] == "All")
-    )
-    rural = tx[rural_urban_filter & (tx["Bene_RUCA_Desc"] == "Rural")].copy()
-    urban = tx[rural_urban_filter & (tx["Bene_RUCA_Desc"] == "Urban")].copy()
-    
-    # Convert to percentages and add year column
-    for data in [medicare_only, dual, rural, urban]:
-        data["telehealth_pct"] = data["Pct_Telehealth"] * 100
-        data["year"] = data["Year"].astype(int)
+    # Rural vs Urban (for all enrollment) - not plotted, so missing rows are allowed
+    rural = get_series("All", "Rural", required=False)
+    urban = get_series("All", "Urban", required=False)
     
     return medicare_only, dual, rural, urban
 
 
+def merge_on_geoid(left, right, how):
+    """
+    Merge two frames on their categorical GEOID column.
+    Both sides are given the same category set first so the key stays
+    categorical (mismatched categories would fall back to object dtype).
+    """
+    categories = pd.api.types.union_categoricals(
+        [left["GEOID"], right["GEOID"]], sort_categories=True
+    ).categories
+    left = left.assign(GEOID=pd.Categorical(left["GEOID"], categories=categories))
+    right = right.assign(GEOID=pd.Categorical(right["GEOID"], categories=categories))
+    return left.merge(right, on="GEOID", how=how)
+
+
+# -------------------------------------------------------------------
+# DATA CACHE
+# -------------------------------------------------------------------
+def load_cached(loader, source_path, cache_names, reader=pd.read_parquet):
+    """
+    Run a loader, reusing Parquet copies of its output while they are newer
+    than both the source file and this script.
+    Loaders that return a tuple of frames get one cache file per frame.
+    """
+    cache_paths = [CACHE_DIR / name for name in cache_names]
+    sources = [source_path] + ([SCRIPT_PATH] if SCRIPT_PATH else [])
+    source_mtime = max(path.stat().st_mtime for path in sources)
+    
+    if all(path.exists() and path.stat().st_mtime > source_mtime for path in cache_paths):
+        frames = [reader(path) for path in cache_paths]
+    else:
+        result = loader()
+        frames = list(result) if isinstance(result, tuple) else [result]
+        if len(frames) != len(cache_paths):
+            raise ValueError(
+                f"{loader.__name__} returned {len(frames)} frame(s) "
+                f"but {len(cache_paths)} cache name(s) were given"
+            )
+        CACHE_DIR.mkdir(exist_ok=True)
+        for frame, path in zip(frames, cache_paths):
+            frame.to_parquet(path)
+    
+    return tuple(frames) if len(frames) > 1 else frames[0]
+
+
+# -------------------------------------------------------------------
+# GEOMETRY HELPERS
+# -------------------------------------------------------------------
+def county_centroids(gdf):
+    """
+    Return (lon, lat) arrays of geometry centroids.
+    Centroids are computed in Web Mercator (EPSG:3857) for accuracy,
+    then converted back to lon/lat.
+    """
+    projected = np.asarray(gdf.geometry.to_crs(epsg=3857).values)
+    centroids = gpd.GeoSeries(shapely.centroid(projected), crs=3857).to_crs(epsg=4326)
+    points = np.asarray(centroids.values)
+    return shapely.get_x(points), shapely.get_y(points)
+
+
 # -------------------------------------------------------------------
 # CALCULATE TELEHEALTH NEED INDEX
 # -------------------------------------------------------------------
@@ -156,46 +225,63 @@ def calculate_need_index(county_data):
     
     Higher = Greater potential benefit from telehealth access
     """
-    df = county_data.copy()
-    
-    # Normalize each factor to 0-1 scale
-    df["uninsured_norm"] = (df["uninsured_pct"] - df["uninsured_pct"].min()) / \
-                           (df["uninsured_pct"].max() - df["uninsured_pct"].min())
-    
-    df["poverty_norm"] = (df["poverty_rate"] - df["poverty_rate"].min()) / \
-                         (df["poverty_rate"].max() - df["poverty_rate"].min())
-    
-    # Combine into Need Index (equal weighting, scale 0-100)
-    df["need_index"] = ((df["uninsured_norm"] + df["poverty_norm"]) / 2) * 100
-    
-    # Categorize
-    df["need_category"] = pd.cut(
-        df["need_index"],
-        bins=[0, 25, 50, 75, 100],
-        labels=["Low Need", "Moderate Need", "High Need", "Critical Need"],
-        include_lowest=True
+    uninsured = county_data["uninsured_pct"].to_numpy(dtype=float)
+    poverty = county_data["poverty_rate"].to_numpy(dtype=float)
+    
+    # Normalize each factor to 0-1 scale, then combine with equal weighting (scale 0-100)
+    # (nan-aware min/max so a missing value only affects its own county)
+    uninsured_min, poverty_min = np.nanmin(uninsured), np.nanmin(poverty)
+    need_index = ((uninsured - uninsured_min) / (np.nanmax(uninsured) - uninsured_min) +
+                  (poverty - poverty_min) / (np.nanmax(poverty) - poverty_min)) * 50.0
+    county_data["need_index"] = need_index
+    
+    # Categorize into quartile bands: [0, 25], (25, 50], (50, 75], (75, 100]
+    codes = np.searchsorted([25, 50, 75], need_index, side="left")
+    # Counties with a missing factor have a NaN index; code -1 leaves them uncategorized
+    codes = np.where(np.isnan(need_index), -1, codes)
+    county_data["need_category"] = pd.Categorical.from_codes(
+        codes,
+        categories=["Low Need", "Moderate Need", "High Need", "Critical Need"],
+        ordered=True
     )
     
-    return df
+    return county_data
 
 
 # -------------------------------------------------------------------
 # BUILD THE PARADOX VISUALIZATION
 # -------------------------------------------------------------------
-def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible):
+def build_paradox_dashboard(map_data, county_data, medicare_only, dual_eligible):
     """
     Create the main visualization showing the telehealth paradox:
     - Map of county need
     - Timeline of state adoption
     - The paradox: high-need areas lack access while low-income users adopt MORE
+    
+    map_data is read-only here and must already carry lon/lat centroid columns.
     """
     
-    # Merge county data with geometries
-    map_data = counties.merge(county_data, on="GEOID", how="left")
-    geojson = json.loads(map_data.to_json())
+    geojson = {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "id": geoid, "properties": {"GEOID": geoid}, "geometry": mapping(geom)}
+            for geoid, geom in zip(map_data["GEOID"], map_data.geometry)
+        ]
+    }
     
-    # Identify top 10 highest need counties
-    top_need = county_data.nlargest(10, "need_index")
+    # Identify top 10 highest need counties, matching nlargest(keep="first"):
+    # partition out the 10th-largest value, take everything above it plus the
+    # earliest rows tied with it, then sort just those, highest first
+    need = county_data["need_index"].to_numpy()
+    valid = np.flatnonzero(~np.isnan(need))
+    valid_need = need[valid]
+    n_top = min(10, len(valid))
+    cutoff = np.partition(valid_need, len(valid) - n_top)[len(valid) - n_top] if n_top else np.inf
+    above = valid[valid_need > cutoff]
+    tied = valid[valid_need == cutoff][:n_top - len(above)]
+    top_idx = np.sort(np.concatenate([above, tied]))
+    top_idx = top_idx[np.argsort(-need[top_idx], kind="stable")]
+    top_need = county_data.iloc[top_idx]
     
     # Create figure with subplots - simple 2x2 grid
     fig = make_subplots(
@@ -216,6 +302,9 @@ def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
         vertical_spacing=0.15
     )
     
+    # Traces are collected as (trace, row, col) and added to the figure in one batch
+    subplot_traces = []
+    
     # ===== MAP: County Need Index =====
     # Custom colorscale: Blue (low need) -> Yellow -> Orange -> Red (critical need)
     colorscale = [
@@ -226,7 +315,7 @@ def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
         [1.0, "#b71c1c"]     # Deep red - critical
     ]
     
-    fig.add_trace(
+    subplot_traces.append((
         go.Choropleth(
             geojson=geojson,
             locations=map_data["GEOID"],
@@ -248,31 +337,29 @@ def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
                 ticktext=["Low", "50", "High"],
                 tickfont=dict(size=9)
             ),
-            hovertemplate="<b>%{customdata[0]}</b><br>" +
+            hovertemplate="<b>%{hovertext}</b><br>" +
                          "Need Index: %{z:.1f}<br>" +
-                         "Uninsured: %{customdata[1]:.1f}%<br>" +
-                         "Poverty: %{customdata[2]:.1f}%<br>" +
-                         "Median Income: $%{customdata[3]:,.0f}<extra></extra>",
+                         "Uninsured: %{customdata[0]:.1f}%<br>" +
+                         "Poverty: %{customdata[1]:.1f}%<br>" +
+                         "Median Income: $%{customdata[2]:,.0f}<extra></extra>",
+            # Names go in hovertext so customdata stays a compact numeric array
+            hovertext=map_data["County_Name"].astype(object).fillna("Unknown").to_numpy(),
             customdata=np.column_stack([
-                map_data["County_Name"].fillna("Unknown"),
-                map_data["uninsured_pct"].fillna(0),
-                map_data["poverty_rate"].fillna(0),
-                map_data["median_income"].fillna(0)
+                map_data["uninsured_pct"].fillna(0).to_numpy(np.float32),
+                map_data["poverty_rate"].fillna(0).to_numpy(np.float32),
+                map_data["median_income"].fillna(0).to_numpy(np.float32)
             ])
         ),
-        row=1, col=1
-    )
+        1, 1
+    ))
     
     # Add markers for top 10 highest need counties
-    top_need_geo = map_data[map_data["GEOID"].isin(top_need["GEOID"])]
+    top_need_geo = map_data[map_data["GEOID"].isin(set(top_need["GEOID"]))]
     if len(top_need_geo) > 0:
-        # Project to get accurate centroids
-        centroids_proj = top_need_geo.to_crs(epsg=3857).geometry.centroid.to_crs(epsg=4326)
-        
-        fig.add_trace(
+        subplot_traces.append((
             go.Scattergeo(
-                lon=centroids_proj.x,
-                lat=centroids_proj.y,
+                lon=top_need_geo["lon"].values,
+                lat=top_need_geo["lat"].values,
                 mode="markers+text",
                 marker=dict(size=10, color="white", line=dict(color="black", width=2)),
                 text=top_need_geo["County_Name"].str[:3].str.upper(),
@@ -282,20 +369,15 @@ def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
                 showlegend=False,
                 hoverinfo="skip"
             ),
-            row=1, col=1
-        )
+            1, 1
+        ))
     
     # ===== COUNTY SEARCH DROPDOWN =====
-    # Calculate centroids for all counties
-    all_centroids = map_data.copy()
-    all_centroids["centroid"] = all_centroids.to_crs(epsg=3857).geometry.centroid.to_crs(epsg=4326)
-    all_centroids["lon"] = all_centroids["centroid"].x
-    all_centroids["lat"] = all_centroids["centroid"].y
-    all_centroids = all_centroids.dropna(subset=["County_Name", "lon", "lat"])
+    all_centroids = map_data.dropna(subset=["County_Name", "lon", "lat"])
     all_centroids = all_centroids.sort_values("County_Name")
     
     # Add invisible highlight marker (will be updated by dropdown)
-    fig.add_trace(
+    subplot_traces.append((
         go.Scattergeo(
             lon=[all_centroids["lon"].iloc[0]],
             lat=[all_centroids["lat"].iloc[0]],
@@ -310,10 +392,11 @@ def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
             showlegend=False,
             hoverinfo="skip"
         ),
-        row=1, col=1
-    )
+        1, 1
+    ))
     
     # Create dropdown buttons for county search
+    highlight_idx = len(subplot_traces) - 1  # Index of highlight trace
     dropdown_buttons = [
         dict(
             label="-- Search County --",
@@ -321,18 +404,20 @@ def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
             args=[
                 {"marker.color": ["rgba(0,0,0,0)"]},
                 {},
-                [len(fig.data) - 1]  # Index of highlight trace
+                [highlight_idx]
             ]
         )
     ]
     
-    for _, row in all_centroids.iterrows():
-        county_name = row["County_Name"]
-        lon, lat = row["lon"], row["lat"]
-        need_idx = row.get("need_index", 0)
-        unins = row.get("uninsured_pct", 0)
-        pov = row.get("poverty_rate", 0)
-        
+    county_rows = zip(
+        all_centroids["County_Name"].to_numpy(),
+        all_centroids["lon"].to_numpy(),
+        all_centroids["lat"].to_numpy(),
+        all_centroids["need_index"].to_numpy(),
+        all_centroids["uninsured_pct"].to_numpy(),
+        all_centroids["poverty_rate"].to_numpy()
+    )
+    for county_name, lon, lat, need_idx, unins, pov in county_rows:
         dropdown_buttons.append(
             dict(
                 label=f"{county_name}",
@@ -347,14 +432,14 @@ def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
                     {"title.text": f"<b>THE TELEHEALTH PARADOX</b><br>" +
                                    f"<sup style='color:#0ff'>{county_name} County - Need: {need_idx:.0f} | " +
                                    f"Uninsured: {unins:.1f}% | Poverty: {pov:.1f}%</sup>"},
-                    [len(fig.data) - 1]
+                    [highlight_idx]
                 ]
             )
         )
     
     # ===== TIMELINE: State Telehealth Adoption (2020-2024) =====
     # Medicare Only (higher income)
-    fig.add_trace(
+    subplot_traces.append((
         go.Scatter(
             x=medicare_only["year"],
             y=medicare_only["telehealth_pct"],
@@ -364,11 +449,11 @@ def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
             marker=dict(size=8),
             hovertemplate="%{x}: %{y:.1f}%<extra>Medicare Only</extra>"
         ),
-        row=1, col=2
-    )
+        1, 2
+    ))
     
     # Dual-eligible (low-income)
-    fig.add_trace(
+    subplot_traces.append((
         go.Scatter(
             x=dual_eligible["year"],
             y=dual_eligible["telehealth_pct"],
@@ -378,8 +463,8 @@ def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
             marker=dict(size=10),
             hovertemplate="%{x}: %{y:.1f}%<extra>Low-Income (Dual)</extra>"
         ),
-        row=1, col=2
-    )
+        1, 2
+    ))
     
     # Add annotation showing the paradox - more prominent
     fig.add_annotation(
@@ -402,21 +487,23 @@ def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
     )
     
     # Add shaded area between the two lines to highlight the gap
-    fig.add_trace(
+    gap_years = medicare_only["year"].to_numpy()
+    subplot_traces.append((
         go.Scatter(
-            x=list(medicare_only["year"]) + list(medicare_only["year"][::-1]),
-            y=list(dual_eligible["telehealth_pct"]) + list(medicare_only["telehealth_pct"][::-1]),
+            x=np.concatenate([gap_years, gap_years[::-1]]),
+            y=np.concatenate([dual_eligible["telehealth_pct"].to_numpy(),
+                              medicare_only["telehealth_pct"].to_numpy()[::-1]]),
             fill="toself",
             fillcolor="rgba(233,30,99,0.15)",
             line=dict(width=0),
             showlegend=False,
             hoverinfo="skip"
         ),
-        row=1, col=2
-    )
+        1, 2
+    ))
     
     # Add COVID-19 impact shaded region as a filled trace (2020-2021)
-    fig.add_trace(
+    subplot_traces.append((
         go.Scatter(
             x=[2020, 2020, 2021, 2021, 2020],
             y=[0, 65, 65, 0, 0],
@@ -428,8 +515,8 @@ def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
             showlegend=False,
             hoverinfo="skip"
         ),
-        row=1, col=2
-    )
+        1, 2
+    ))
     
     # COVID annotation - positioned at top of shaded region
     fig.add_annotation(
@@ -446,15 +533,10 @@ def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
     )
     
     # ===== BAR CHART: Top 10 Need Counties =====
-    top_need_sorted = top_need.sort_values("need_index", ascending=True)
+    # Reverse the descending top 10 so the highest need bar is drawn at the top
+    top_need_sorted = top_need.iloc[::-1]
     
-    # Color bars by need index
-    bar_colors = [
-        f"rgb({int(180 + (val/100)*75)}, {int(100 - (val/100)*80)}, {int(50 - (val/100)*30)})"
-        for val in top_need_sorted["need_index"]
-    ]
-    
-    fig.add_trace(
+    subplot_traces.append((
         go.Bar(
             y=top_need_sorted["County_Name"],
             x=top_need_sorted["need_index"],
@@ -472,9 +554,11 @@ def build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
                          "<extra></extra>",
             showlegend=False
         ),
-        row=2, col=2
-    )
+        2, 2
+    ))
     
+    traces, rows, cols = zip(*subplot_traces)
+    fig.add_traces(list(traces), rows=list(rows), cols=list(cols))
     
     # ===== LAYOUT =====
     fig.update_layout(
@@ -597,10 +681,11 @@ def build_need_income_analysis(county_data):
         "Critical Need": "#b71c1c"
     }
     
+    traces = []
     for cat in ["Low Need", "Moderate Need", "High Need", "Critical Need"]:
         subset = county_data[county_data["need_category"] == cat]
         if len(subset) > 0:
-            fig.add_trace(go.Scatter(
+            traces.append(go.Scatter(
                 x=subset["median_income"],
                 y=subset["need_index"],
                 mode="markers",
@@ -622,7 +707,7 @@ def build_need_income_analysis(county_data):
     p = np.poly1d(z)
     x_line = np.linspace(county_data["median_income"].min(), county_data["median_income"].max(), 100)
     
-    fig.add_trace(go.Scatter(
+    traces.append(go.Scatter(
         x=x_line,
         y=p(x_line),
         mode="lines",
@@ -631,6 +716,8 @@ def build_need_income_analysis(county_data):
         hoverinfo="skip"
     ))
     
+    fig.add_traces(traces)
+    
     fig.update_layout(
         title=dict(
             text="<b>The Resource Gap: Higher Need = Lower Income</b><br>" +
@@ -666,35 +753,29 @@ def build_need_income_analysis(county_data):
 # -------------------------------------------------------------------
 # BUILD GEOGRAPHIC PATTERN ANALYSIS
 # -------------------------------------------------------------------
-def build_geographic_patterns(counties, county_data):
+def build_geographic_patterns(map_data):
     """
     Show regional patterns - border counties, rural West Texas, etc.
-    """
-    map_data = counties.merge(county_data, on="GEOID", how="left")
     
+    map_data is read-only here and must already carry lon/lat centroid columns.
+    """
     # Calculate regional statistics
     # Define regions by latitude/longitude of centroids
-    map_data["centroid"] = map_data.geometry.centroid
-    map_data["lon"] = map_data["centroid"].x
-    map_data["lat"] = map_data["centroid"].y
-    
-    # Rough regional classification
-    def classify_region(row):
-        if row["lat"] < 28:  # Southern border
-            return "Border Region"
-        elif row["lon"] < -102:  # West Texas
-            return "West Texas"
-        elif row["lon"] > -96 and row["lat"] > 32:  # DFW Metro area
-            return "North Texas Urban"
-        elif row["lon"] > -96 and row["lat"] < 30:  # Houston area
-            return "Gulf Coast Urban"
-        else:
-            return "Central Texas"
-    
-    map_data["region"] = map_data.apply(classify_region, axis=1)
+    # Rough regional classification (first matching condition wins)
+    lat = map_data["lat"].values
+    lon = map_data["lon"].values
+    conditions = [
+        lat < 28,                   # Southern border
+        lon < -102,                 # West Texas
+        (lon > -96) & (lat > 32),   # DFW Metro area
+        (lon > -96) & (lat < 30),   # Houston area
+    ]
+    choices = ["Border Region", "West Texas", "North Texas Urban", "Gulf Coast Urban"]
+    region = pd.Series(np.select(conditions, choices, default="Central Texas"),
+                       index=map_data.index, name="region")
     
     # Create regional summary
-    regional_stats = map_data.groupby("region").agg({
+    regional_stats = map_data.groupby(region).agg({
         "need_index": "mean",
         "uninsured_pct": "mean",
         "poverty_rate": "mean",
@@ -757,22 +838,27 @@ def main():
     
     # Load data
     print("Loading data...")
-    counties = load_texas_counties()
+    counties = load_cached(load_texas_counties, SHAPEFILE_PATH, ["counties.parquet"],
+                           reader=gpd.read_parquet)
     print(f"  - {len(counties)} county geometries")
     
-    sahie = load_sahie()
+    sahie = load_cached(load_sahie, SAHIE_PATH, ["sahie.parquet"])
     print(f"  - {len(sahie)} county uninsured records")
     
-    saipe = load_saipe()
+    saipe = load_cached(load_saipe, SAIPE_PATH, ["saipe.parquet"])
     print(f"  - {len(saipe)} county poverty records")
     
-    medicare_only, dual_eligible, rural, urban = load_telehealth_trends()
+    medicare_only, dual_eligible, rural, urban = load_cached(
+        load_telehealth_trends, TELEHEALTH_PATH,
+        ["telehealth_medicare_only.parquet", "telehealth_dual.parquet",
+         "telehealth_rural.parquet", "telehealth_urban.parquet"]
+    )
     years = sorted(medicare_only["year"].unique())
     print(f"  - Telehealth data: {years[0]}-{years[-1]} ({len(medicare_only)} annual records)")
     
     # Merge county data
     print("\nCalculating Telehealth Need Index...")
-    county_data = sahie.merge(saipe, on="GEOID", how="inner")
+    county_data = merge_on_geoid(sahie, saipe, how="inner")
     county_data = calculate_need_index(county_data)
     
     # Print summary statistics
@@ -792,23 +878,40 @@ def main():
     # Build visualizations
     print("\nBuilding visualizations...")
     
+    # Merge county data with geometries (shared by the map-based figures)
+    map_data = merge_on_geoid(counties, county_data, how="left")
+    # Project once to get accurate centroids for every county
+    map_data["lon"], map_data["lat"] = county_centroids(map_data)
+    
     print("  - Main paradox dashboard...")
-    fig_main = build_paradox_dashboard(counties, county_data, medicare_only, dual_eligible)
+    fig_main = build_paradox_dashboard(map_data, county_data, medicare_only, dual_eligible)
     
     print("  - Need vs income analysis...")
     fig_scatter = build_need_income_analysis(county_data)
     
     print("  - Regional patterns...")
-    fig_regional, regional_stats = build_geographic_patterns(counties, county_data)
+    fig_regional, regional_stats = build_geographic_patterns(map_data)
     
-    # Display
-    print("\n" + "="*65)
-    print("  Opening visualizations in browser...")
-    print("="*65)
+    # Display (or write standalone HTML files when running headless)
+    figures = {
+        "paradox_dashboard": fig_main,
+        "need_vs_income": fig_scatter,
+        "regional_patterns": fig_regional
+    }
     
-    fig_main.show()
-    fig_scatter.show()
-    fig_regional.show()
+    print("\n" + "="*65)
+    if os.environ.get("HEADLESS", "").strip().lower() in {"1", "true", "yes"}:
+        print("  Writing visualizations to HTML...")
+        print("="*65)
+        for name, fig in figures.items():
+            out_path = ROOT / f"{name}.html"
+            fig.write_html(out_path, include_plotlyjs="cdn")
+            print(f"  - {out_path.name}")
+    else:
+        print("  Opening visualizations in browser...")
+        print("="*65)
+        for fig in figures.values():
+            fig.show()
     
     print("""
 ===================================================================